@@ -49,7 +49,6 @@ function FunctionPlot({ functionExpression, interval = [-5, 5], root = null, ite
       const numPoints = 200;
       const step = (xMax - xMin) / numPoints;
       const functionPoints = [];
-      const labels = [];
 
       for (let i = 0; i <= numPoints; i++) {
         const x = xMin + i * step;
@@ -57,7 +56,6 @@ function FunctionPlot({ functionExpression, interval = [-5, 5], root = null, ite
           const y = f(x);
           if (isFinite(y) && Math.abs(y) < 1e6) { // Avoid extreme values
             functionPoints.push({ x, y });
-            labels.push(x.toFixed(3));
           }
         } catch (_error) { // eslint-disable-line no-unused-vars
           // Skip points where function can't be evaluated
@@ -129,9 +127,10 @@ function FunctionPlot({ functionExpression, interval = [-5, 5], root = null, ite
       ];
 
       // Add root point if available
+      let rootY = null;
       if (root !== null && isFinite(root)) {
         try {
-          const rootY = f(root);
+          rootY = f(root);
           datasets.push({
             label: 'Root',
             data: [{ x: root, y: rootY }],
@@ -167,7 +166,8 @@ function FunctionPlot({ functionExpression, interval = [-5, 5], root = null, ite
         const iterationPoints = [];
         iterationHistory.forEach((iteration, _index) => { // eslint-disable-line no-unused-vars
           try {
-            const y = f(iteration.xValue);
+            // The final iterate is usually the root itself, already evaluated above
+            const y = iteration.xValue === root && rootY !== null ? rootY : f(iteration.xValue);
             if (isFinite(y) && Math.abs(y) < 1e6) {
               iterationPoints.push({
                 x: iteration.xValue,
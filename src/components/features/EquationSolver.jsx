@@ -16,7 +16,9 @@ import {
   Alert,
   Chip,
   LinearProgress,
-  IconButton
+  IconButton,
+  FormControlLabel,
+  Checkbox
 } from '@mui/material';
 import {
   PlayArrow as PlayIcon,
@@ -109,6 +111,10 @@ function EquationSolver() {
   const [result, setResult] = useState(null);
   const [isComputing, setIsComputing] = useState(false);
   const [useCustom, setUseCustom] = useState(false);
+  const [newtonOptions, setNewtonOptions] = useState({
+    quasiNewton: false,
+    lineSearch: false
+  });
 
   // Update parameters when function changes
   useEffect(() => {
@@ -130,6 +136,13 @@ function EquationSolver() {
     }));
   };
 
+  const handleNewtonOptionChange = (option) => (event) => {
+    setNewtonOptions(prev => ({
+      ...prev,
+      [option]: event.target.checked
+    }));
+  };
+
   const getCurrentFunction = () => {
     if (useCustom && customFunction.trim()) {
       // Convert superscript notation to caret notation for processing
@@ -183,10 +196,11 @@ function EquationSolver() {
           methodResult = falsePositionMethod(func.expression, parseFloat(parameters.a), parseFloat(parameters.b), tolerance, maxIterations);
           break;
         case 'newtonRaphson':
-          if (!func.derivative) {
+          if (!func.derivative && !newtonOptions.quasiNewton) {
             throw new Error('Newton-Raphson method requires a derivative function');
           }
-          methodResult = newtonRaphsonMethod(func.expression, func.derivative, parseFloat(parameters.guess), tolerance, maxIterations);
+          // Quasi-Newton builds its slopes from f alone, so the derivative is not passed
+          methodResult = newtonRaphsonMethod(func.expression, newtonOptions.quasiNewton ? null : func.derivative, parseFloat(parameters.guess), tolerance, maxIterations, newtonOptions);
           break;
         case 'secant':
           methodResult = secantMethod(func.expression, parseFloat(parameters.a), parseFloat(parameters.b), tolerance, maxIterations);
@@ -301,7 +315,7 @@ function EquationSolver() {
                     value={customDerivative}
                     onChange={(e) => setCustomDerivative(e.target.value)}
                     sx={{ mb: 2 }}
-                    helperText="Required for Newton-Raphson method"
+                    helperText="Required for Newton-Raphson method unless Quasi-Newton is selected"
                   />
                 </Box>
               )}
@@ -387,6 +401,19 @@ function EquationSolver() {
                   </Grid>
                 )}
 
+                {method === 'newtonRaphson' && (
+                  <Grid item xs={12}>
+                    <FormControlLabel
+                      control={<Checkbox checked={newtonOptions.quasiNewton} onChange={handleNewtonOptionChange('quasiNewton')} size="small" />}
+                      label="Quasi-Newton (secant slopes, no derivative needed)"
+                    />
+                    <FormControlLabel
+                      control={<Checkbox checked={newtonOptions.lineSearch} onChange={handleNewtonOptionChange('lineSearch')} size="small" />}
+                      label="Line search (halve steps that increase |f(x)|)"
+                    />
+                  </Grid>
+                )}
+
                 {method === 'muller' && (
                   <>
                     <Grid item xs={4}>
@@ -43,6 +43,7 @@ import {
   hornersRuleDetailed, 
   polynomialDeflation, 
   successiveDeflation,
+  findAllRootsAberth,
   parseCoefficients,
   createPolynomialString
 } from '../../utils/polynomialUtils';
@@ -83,6 +84,13 @@ function Utilities() {
   const [successiveResults, setSuccessiveResults] = useState(null);
   const [successiveError, setSuccessiveError] = useState('');
 
+  // All Roots State
+  const [allRootsParams, setAllRootsParams] = useState({
+    coefficients: '1 0 -1 -1' // Example: x³ - x - 1, one real and two complex roots
+  });
+  const [allRootsResults, setAllRootsResults] = useState(null);
+  const [allRootsError, setAllRootsError] = useState('');
+
   const [activeUtility, setActiveUtility] = useState('incremental');
 
   // Incremental Search Handler
@@ -155,6 +163,20 @@ function Utilities() {
     }
   };
 
+  // All Roots Handler
+  const handleAllRoots = () => {
+    try {
+      setAllRootsError('');
+      const coeffs = parseCoefficients(allRootsParams.coefficients);
+      
+      const results = findAllRootsAberth(coeffs);
+      setAllRootsResults(results);
+    } catch (error) {
+      setAllRootsError(error.message);
+      setAllRootsResults(null);
+    }
+  };
+
   const utilities = [
     { 
       value: 'incremental', 
@@ -179,6 +201,12 @@ function Utilities() {
       label: 'Successive Deflation', 
       icon: <LoopIcon className="icon-spiral icon-levitate" />,
       description: 'Apply multiple deflations with known roots'
+    },
+    { 
+      value: 'allRoots', 
+      label: 'All Roots', 
+      icon: <FunctionsIcon className="icon-orbit icon-breathe" />,
+      description: 'Find every real and complex root at once (Aberth method)'
     }
   ];
 
@@ -643,6 +671,95 @@ function Utilities() {
             </CardContent>
           </Card>
         )}
+
+        {/* All Roots */}
+        {activeUtility === 'allRoots' && (
+          <Card className="fade-in-right card-hover-lift" sx={{ minHeight: 450, bgcolor: 'background.paper' }}>
+            <CardContent>
+              <Typography variant="h5" gutterBottom>
+                <FunctionsIcon className="icon-bob icon-glow-soft" sx={{ marginRight: '10px' }} />
+                All Roots
+              </Typography>
+                          <Typography variant="body2" color="text.secondary" sx={{ mb: 3 }}>
+              Refine approximations to every root simultaneously with the Aberth method, without deflation.
+            </Typography>
+
+            <Grid container spacing={3} sx={{ width: '100%', m: 0 }}>
+              <Grid item xs={12} lg={6}>
+                  <TextField
+                    fullWidth
+                    label="Polynomial Coefficients"
+                    value={allRootsParams.coefficients}
+                    onChange={(e) => setAllRootsParams({...allRootsParams, coefficients: e.target.value})}
+                    placeholder="e.g., 1 0 -1 -1"
+                    helperText="Enter coefficients from highest to lowest degree"
+                    sx={{ mb: 2 }}
+                  />
+                  <Button
+                    variant="contained"
+                    onClick={handleAllRoots}
+                    startIcon={<PlayArrowIcon className="icon-pulse" />}
+                    className="pulse-button"
+                  >
+                    Find All Roots
+                  </Button>
+              </Grid>
+
+              <Grid item xs={12} lg={6}>
+                  {allRootsError && (
+                    <Alert severity="error" sx={{ mb: 2 }}>
+                      {allRootsError}
+                    </Alert>
+                  )}
+
+                  {allRootsResults && (
+                    <Paper sx={{ p: 2 }}>
+                      <Typography variant="h6" gutterBottom>
+                        All Roots Results
+                      </Typography>
+                      <Box sx={{ mb: 2 }}>
+                        <Chip
+                          label={allRootsResults.converged ? 'Converged' : 'Not converged'}
+                          color={allRootsResults.converged ? 'success' : 'warning'}
+                          size="small"
+                          sx={{ mr: 1 }}
+                        />
+                        <Chip label={`Iterations: ${allRootsResults.iterations}`} size="small" />
+                      </Box>
+
+                      <TableContainer component={Paper} variant="outlined">
+                        <Table size="small">
+                          <TableHead>
+                            <TableRow>
+                              <TableCell>#</TableCell>
+                              <TableCell align="right">Real Part</TableCell>
+                              <TableCell align="right">Imaginary Part</TableCell>
+                            </TableRow>
+                          </TableHead>
+                          <TableBody>
+                            {allRootsResults.roots.map((root, index) => (
+                              <TableRow key={index}>
+                                <TableCell>{index + 1}</TableCell>
+                                <TableCell align="right" sx={{ fontFamily: 'monospace' }}>{root.re.toFixed(8)}</TableCell>
+                                <TableCell align="right" sx={{ fontFamily: 'monospace' }}>{root.im.toFixed(8)}</TableCell>
+                              </TableRow>
+                            ))}
+                          </TableBody>
+                        </Table>
+                      </TableContainer>
+
+                      {allRootsResults.roots.length === 0 && (
+                        <Typography color="text.secondary" sx={{ mt: 2 }}>
+                          A constant polynomial has no roots.
+                        </Typography>
+                      )}
+                    </Paper>
+                  )}
+                </Grid>
+              </Grid>
+            </CardContent>
+          </Card>
+        )}
               </div>
     </Box>
   );
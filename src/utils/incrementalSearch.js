@@ -1,6 +1,12 @@
 // Incremental Search utility - finds intervals where function changes sign (potential roots)
-import { evaluate } from 'mathjs';
-import { normalizeExpression } from './numericalMethods.js';
+import { createFunction, prepareExpression } from './numericalMethods.js';
+import { hornersRuleBatch } from './polynomialUtils.js';
+
+// Slack when counting grid steps, so an end point that is a whole number of increments away is kept
+const GRID_TOLERANCE = 1e-9;
+
+// Largest number of increments one scan may take
+const MAX_GRID_STEPS = 100000;
 
 // Performs incremental search to find intervals containing roots by checking sign changes
 export function incrementalSearch(func, start, end, increment) {
@@ -8,6 +14,10 @@ export function incrementalSearch(func, start, end, increment) {
     throw new Error('Function cannot be empty');
   }
 
+  if (!Number.isFinite(start) || !Number.isFinite(end) || !Number.isFinite(increment)) {
+    throw new Error('Start, end and increment must be finite numbers');
+  }
+
   if (start >= end) {
     throw new Error('Start value must be less than end value');
   }
@@ -16,37 +26,51 @@ export function incrementalSearch(func, start, end, increment) {
     throw new Error('Increment must be positive');
   }
 
-  // Use comprehensive normalization to handle all expression formats
-  const processedFunc = normalizeExpression(func);
+  // Grid points are start + i * increment, so rounding does not accumulate from step to step
+  const steps = Math.floor((end - start) / increment + GRID_TOLERANCE);
+  if (steps > MAX_GRID_STEPS) {
+    throw new Error(`Increment too small for range: at most ${MAX_GRID_STEPS} steps are allowed`);
+  }
 
   const intervals = [];
   const evaluations = [];
   
   try {
-    let x = start;
-    let prevF = evaluate(processedFunc, { x: x });
+    // Normalizes all expression formats and parses once for the whole scan
+    const { coefficients } = prepareExpression(func).compiled;
+    
+    const xValues = new Array(steps + 1);
+    for (let i = 0; i <= steps; i++) {
+      xValues[i] = start + i * increment;
+    }
+    
+    // Polynomials are evaluated over the whole grid in one batched Horner pass
+    const fValues = coefficients ? hornersRuleBatch(coefficients, xValues) : xValues.map(createFunction(func));
     
-    evaluations.push({ x: x, fx: prevF });
+    let prevX = xValues[0];
+    let prevF = fValues[0];
     
-    x += increment;
+    evaluations.push({ x: prevX, fx: prevF });
     
-    while (x <= end) {
-      const currentF = evaluate(processedFunc, { x: x });
+    for (let i = 1; i <= steps; i++) {
+      const x = xValues[i];
+      const currentF = fValues[i];
       evaluations.push({ x: x, fx: currentF });
       
-      // Check for sign change (potential root)
-      if (prevF * currentF < 0) {
+      // Check for sign change (potential root), or a grid point landing exactly on a root (including start);
+      // comparing signs rather than the product f(a)*f(b) cannot underflow to zero for tiny values
+      if (Math.sign(prevF) * Math.sign(currentF) < 0 || currentF === 0 || (i === 1 && prevF === 0)) {
         intervals.push({
-          a: x - increment,
+          a: prevX,
           b: x,
           fa: prevF,
           fb: currentF,
-          signChange: `f(${(x - increment).toFixed(6)}) = ${prevF.toFixed(6)}, f(${x.toFixed(6)}) = ${currentF.toFixed(6)}`
+          signChange: `f(${prevX.toFixed(6)}) = ${prevF.toFixed(6)}, f(${x.toFixed(6)}) = ${currentF.toFixed(6)}`
         });
       }
       
+      prevX = x;
       prevF = currentF;
-      x += increment;
     }
     
     return {
@@ -1,4 +1,17 @@
-import { evaluate } from 'mathjs';
+import { compile } from 'mathjs';
+import { compileHorner, hornersRuleWithDerivative, expressionToCoefficients } from './polynomialUtils.js';
+
+// Machine epsilon, scaled by operand magnitude for "too close to zero" checks
+const EPSILON = Number.EPSILON;
+
+// Maximum step halvings per Newton iteration when line search is enabled
+const MAX_BACKTRACKS = 5;
+
+// Iterates beyond this magnitude are treated as diverging
+const DIVERGENCE_LIMIT = 1e10;
+
+// Number of distinct expressions kept normalized and compiled
+const EXPRESSION_CACHE_SIZE = 128;
 
 // Base class for numerical method results
 export class NumericalResult {
@@ -14,6 +27,13 @@ export class NumericalResult {
   }
 }
 
+// Result for a method that threw before producing one, shaped like any other result
+function failedResult(message) {
+  const result = new NumericalResult();
+  result.errorMessage = message;
+  return result;
+}
+
 // Iteration data structure
 export class IterationData {
   constructor(iteration, xValue, fValue, error = null, additionalData = {}) {
@@ -25,14 +45,9 @@ export class IterationData {
   }
 }
 
-// Utility function to evaluate mathematical expressions safely
+// Utility function to evaluate mathematical expressions safely, through the same cached path as createFunction
 export function safeEvaluate(expression, x) {
-  try {
-    const scope = { x, Math, math: Math };
-    return evaluate(expression, scope);
-  } catch (error) {
-    throw new Error(`Error evaluating expression "${expression}" at x=${x}: ${error.message}`);
-  }
+  return createFunction(expression)(x);
 }
 
 // Utility function to normalize mathematical expressions to support dual input modes
@@ -180,10 +195,86 @@ export function normalizeExpression(expression) {
   return normalized;
 }
 
+// Shared stopping test: residual |f(x)| or step size below tolerance
+function hasConverged(fValue, step, tolerance) {
+  return Math.abs(fValue) < tolerance || step < tolerance;
+}
+
+// Central difference approximation of f'(x); the step scales with |x| (cbrt(eps) balances truncation and rounding error)
+function centralDifference(f, x) {
+  const h = Math.cbrt(EPSILON) * Math.max(1, Math.abs(x));
+  return (f(x + h) - f(x - h)) / (2 * h);
+}
+
+// Least-recently-used lookup on a Map; a hit is re-inserted so eviction takes the oldest key
+function cacheGet(cache, key) {
+  const value = cache.get(key);
+  if (value !== undefined) {
+    cache.delete(key);
+    cache.set(key, value);
+  }
+  return value;
+}
+
+function cacheSet(cache, key, value) {
+  cache.set(key, value);
+  if (cache.size > EXPRESSION_CACHE_SIZE) {
+    cache.delete(cache.keys().next().value);
+  }
+}
+
+// Normalized expressions keyed by the raw user input, and compiled evaluators keyed by normalized expression
+const normalizedExpressions = new Map();
+const compiledExpressions = new Map();
+
+// Utility function to parse an expression once into a reusable mathjs evaluator
+export function compileExpression(expression) {
+  const cached = cacheGet(compiledExpressions, expression);
+  if (cached) {
+    return cached;
+  }
+
+  // Expanded polynomials skip mathjs entirely and evaluate by compiled Horner's rule
+  const coefficients = expressionToCoefficients(expression);
+  if (coefficients) {
+    const evaluatePolynomial = compileHorner(coefficients);
+    const polynomial = { evaluate: (scope) => evaluatePolynomial(scope.x), coefficients };
+    cacheSet(compiledExpressions, expression, polynomial);
+    return polynomial;
+  }
+
+  try {
+    const compiled = compile(expression);
+    cacheSet(compiledExpressions, expression, compiled);
+    return compiled;
+  } catch (error) {
+    throw new Error(`Error parsing expression "${expression}": ${error.message}`);
+  }
+}
+
+// Normalizes and compiles a user expression, skipping both steps for recently seen input
+export function prepareExpression(expression) {
+  let normalizedExpression = cacheGet(normalizedExpressions, expression);
+  if (normalizedExpression === undefined) {
+    normalizedExpression = normalizeExpression(expression);
+    cacheSet(normalizedExpressions, expression, normalizedExpression);
+  }
+  return { normalizedExpression, compiled: compileExpression(normalizedExpression) };
+}
+
 // Utility function to create a function from string expression with dual mode support
 export function createFunction(expression) {
-  const normalizedExpression = normalizeExpression(expression);
-  return (x) => safeEvaluate(normalizedExpression, x);
+  const { normalizedExpression, compiled } = prepareExpression(expression);
+  const scope = { x: 0, Math, math: Math };
+
+  return (x) => {
+    try {
+      scope.x = x;
+      return compiled.evaluate(scope);
+    } catch (error) {
+      throw new Error(`Error evaluating expression "${normalizedExpression}" at x=${x}: ${error.message}`);
+    }
+  };
 }
 
 // Test utility to demonstrate dual mode functionality
@@ -198,8 +289,9 @@ export function testDualModeExpressions() {
     { programming: "x^4*log(x) - x^3*sin(x) + x^2*exp(-x) - 4*x + 2", readable: "x^4*log(x) - x^3*sin(x) + x^2*exp(-x) - 4*x + 2" } // Use simpler test case
   ];
 
-  console.log("🧪 Testing Dual Mode Expression Support:");
-  console.log("========================================");
+  const output = [];
+  output.push("🧪 Testing Dual Mode Expression Support:");
+  output.push("========================================");
 
   testCases.forEach((testCase, index) => {
     try {
@@ -213,30 +305,32 @@ export function testDualModeExpressions() {
       
       const match = Math.abs(result1 - result2) < 1e-10;
       
-      console.log(`\nTest ${index + 1}:`);
-      console.log(`  Programming: ${testCase.programming}`);
-      console.log(`  Readable:    ${testCase.readable}`);
-      console.log(`  f(${testX}) = ${result1.toFixed(6)} | ${result2.toFixed(6)}`);
-      console.log(`  Match: ${match ? '✅' : '❌'}`);
+      output.push(`\nTest ${index + 1}:`);
+      output.push(`  Programming: ${testCase.programming}`);
+      output.push(`  Readable:    ${testCase.readable}`);
+      output.push(`  f(${testX}) = ${result1.toFixed(6)} | ${result2.toFixed(6)}`);
+      output.push(`  Match: ${match ? '✅' : '❌'}`);
       
       if (!match) {
-        console.log(`  Normalized Programming: ${normalizeExpression(testCase.programming)}`);
-        console.log(`  Normalized Readable:    ${normalizeExpression(testCase.readable)}`);
+        output.push(`  Normalized Programming: ${normalizeExpression(testCase.programming)}`);
+        output.push(`  Normalized Readable:    ${normalizeExpression(testCase.readable)}`);
       }
     } catch (error) {
-      console.log(`\nTest ${index + 1}: ❌ Error - ${error.message}`);
-      console.log(`  Programming: ${testCase.programming}`);
-      console.log(`  Readable:    ${testCase.readable}`);
+      output.push(`\nTest ${index + 1}: ❌ Error - ${error.message}`);
+      output.push(`  Programming: ${testCase.programming}`);
+      output.push(`  Readable:    ${testCase.readable}`);
     }
   });
 
-  console.log("\n========================================");
+  output.push("\n========================================");
+  console.log(output.join("\n"));
 }
 
 // Simple test function to show dual mode examples
 export function showDualModeExamples() {
-  console.log("📚 Dual Mode Expression Examples:");
-  console.log("=================================");
+  const output = [];
+  output.push("📚 Dual Mode Expression Examples:");
+  output.push("=================================");
   
   const examples = [
     // Basic examples
@@ -262,20 +356,21 @@ export function showDualModeExamples() {
     try {
       const f = createFunction(example.input);
       const result = f(2);
-      console.log(`${index + 1}. ${example.description}`);
-      console.log(`   Input: ${example.input}`);
-      console.log(`   Normalized: ${normalizeExpression(example.input)}`);
-      console.log(`   f(2) = ${result.toFixed(6)}`);
-      console.log("");
+      output.push(`${index + 1}. ${example.description}`);
+      output.push(`   Input: ${example.input}`);
+      output.push(`   Normalized: ${normalizeExpression(example.input)}`);
+      output.push(`   f(2) = ${result.toFixed(6)}`);
+      output.push("");
     } catch (error) {
-      console.log(`${index + 1}. ${example.description}`);
-      console.log(`   Input: ${example.input}`);
-      console.log(`   Error: ${error.message}`);
-      console.log("");
+      output.push(`${index + 1}. ${example.description}`);
+      output.push(`   Input: ${example.input}`);
+      output.push(`   Error: ${error.message}`);
+      output.push("");
     }
   });
   
-  console.log("=================================");
+  output.push("=================================");
+  console.log(output.join("\n"));
 }
 
 // Bisection Method
@@ -321,7 +416,7 @@ export function bisectionMethod(functionExpr, a, b, tolerance = 1e-6, maxIterati
       const error = Math.abs(b - a) / 2;
       result.iterationHistory.push(new IterationData(i + 1, c, fc, error, { a, b, interval: b - a }));
       
-      if (Math.abs(fc) < tolerance || error < tolerance) {
+      if (hasConverged(fc, error, tolerance)) {
         result.root = c;
         result.convergenceAchieved = true;
         result.finalError = Math.abs(fc);
@@ -412,39 +507,107 @@ export function falsePositionMethod(functionExpr, a, b, tolerance = 1e-6, maxIte
   return result;
 }
 
-// Newton-Raphson Method - fast root finding using tangent line approximation (requires derivative)
-export function newtonRaphsonMethod(functionExpr, derivativeExpr, x0, tolerance = 1e-6, maxIterations = 100) {
+// Descending coefficients of f when f is a polynomial and derivativeExpr is exactly its derivative, otherwise null
+function polynomialWithMatchingDerivative(functionExpr, derivativeExpr) {
+  const { coefficients } = prepareExpression(functionExpr).compiled;
+  const derivative = prepareExpression(derivativeExpr).compiled.coefficients;
+  if (!coefficients || !derivative) {
+    return null;
+  }
+  
+  const degree = coefficients.length - 1;
+  const expected = degree === 0 ? [0] : coefficients.slice(0, degree).map((c, i) => c * (degree - i));
+  if (expected.length !== derivative.length) {
+    return null;
+  }
+  for (let i = 0; i < expected.length; i++) {
+    if (Math.abs(expected[i] - derivative[i]) > 4 * EPSILON * Math.max(Math.abs(expected[i]), Math.abs(derivative[i]))) {
+      return null;
+    }
+  }
+  return coefficients;
+}
+
+// Newton-Raphson Method - fast root finding using tangent line approximation (requires derivative unless quasiNewton is set)
+export function newtonRaphsonMethod(functionExpr, derivativeExpr, x0, tolerance = 1e-6, maxIterations = 100, { quasiNewton = false, lineSearch = false } = {}) {
   const result = new NumericalResult();
   const startTime = performance.now();
   
   try {
-    const f = createFunction(functionExpr);
     const df = derivativeExpr ? createFunction(derivativeExpr) : null;
     
-    if (!df) {
+    if (!df && !quasiNewton) {
       throw new Error('Derivative function is required for Newton-Raphson method');
     }
     
+    // A polynomial whose supplied derivative is exactly P' gets P and P' from one Horner pass; P' at the last point is kept for reuse
+    const coefficients = df ? polynomialWithMatchingDerivative(functionExpr, derivativeExpr) : null;
+    let slopePoint = null;
+    let slope = null;
+    const f = coefficients
+      ? (point) => {
+        const fused = hornersRuleWithDerivative(coefficients, point);
+        slopePoint = point;
+        slope = fused.derivative;
+        return fused.value;
+      }
+      : createFunction(functionExpr);
+    
     let x = x0;
     let fx = f(x);
+    let dfx = null;
     result.functionEvaluations++;
     
     for (let i = 0; i < maxIterations; i++) {
-      const dfx = df(x);
-      result.functionEvaluations++;
+      if (coefficients) {
+        // Fusion is only a speed-up: f' still counts as an evaluation, as it would through df,
+        // and a pass that has to be redone counts both its f and f'
+        if (slopePoint !== x) {
+          f(x);
+          result.functionEvaluations++;
+        }
+        dfx = slope;
+        result.functionEvaluations++;
+      } else if (df) {
+        dfx = df(x);
+        result.functionEvaluations++;
+      } else if (dfx === null) {
+        // Quasi-Newton: bootstrap (or rebuild) the slope, then reuse secant slopes
+        dfx = centralDifference(f, x);
+        result.functionEvaluations += 2;
+      }
       
-      if (Math.abs(dfx) < 1e-14) {
+      if (Math.abs(dfx) < EPSILON * Math.max(1, Math.abs(fx))) {
         throw new Error(`Derivative is zero at x = ${x}. Cannot continue with Newton-Raphson method.`);
       }
       
-      const xNew = x - fx / dfx;
-      const fxNew = f(xNew);
+      const step = fx / dfx;
+      let xNew = x - step;
+      let fxNew = f(xNew);
+      let stepScale = 1;
       result.functionEvaluations++;
       
+      // Backtrack along the Newton direction while the full step increases |f|
+      if (lineSearch && Math.abs(fxNew) > Math.abs(fx)) {
+        for (let k = 0, scale = 0.5; k < MAX_BACKTRACKS; k++, scale *= 0.5) {
+          const xTry = x - scale * step;
+          const fxTry = f(xTry);
+          result.functionEvaluations++;
+          
+          if (Math.abs(fxTry) < Math.abs(fx)) {
+            xNew = xTry;
+            fxNew = fxTry;
+            stepScale = scale;
+            break;
+          }
+        }
+      }
+      
       const error = Math.abs(xNew - x);
-      result.iterationHistory.push(new IterationData(i + 1, xNew, fxNew, error, { previousX: x, derivative: dfx }));
+      const details = lineSearch ? { previousX: x, derivative: dfx, stepScale } : { previousX: x, derivative: dfx };
+      result.iterationHistory.push(new IterationData(i + 1, xNew, fxNew, error, details));
       
-      if (Math.abs(fxNew) < tolerance || error < tolerance) {
+      if (hasConverged(fxNew, error, tolerance)) {
         result.root = xNew;
         result.convergenceAchieved = true;
         result.finalError = Math.abs(fxNew);
@@ -452,6 +615,16 @@ export function newtonRaphsonMethod(functionExpr, derivativeExpr, x0, tolerance
         break;
       }
       
+      // Check for divergence
+      if (!Number.isFinite(xNew) || Math.abs(xNew) > DIVERGENCE_LIMIT) {
+        throw new Error('Method appears to be diverging. Try a different initial guess.');
+      }
+      
+      if (!df) {
+        const rise = fxNew - fx;
+        dfx = Math.abs(rise) < EPSILON * Math.max(1, Math.abs(fx), Math.abs(fxNew)) ? null : rise / (xNew - x);
+      }
+      
       x = xNew;
       fx = fxNew;
       result.iterations = i + 1;
@@ -483,18 +656,20 @@ export function secantMethod(functionExpr, x0, x1, tolerance = 1e-6, maxIteratio
     result.functionEvaluations += 2;
     
     for (let i = 0; i < maxIterations; i++) {
-      if (Math.abs(fx1 - fx0) < 1e-14) {
+      const dfx = fx1 - fx0;
+      if (Math.abs(dfx) < EPSILON * Math.max(1, Math.abs(fx0), Math.abs(fx1))) {
         throw new Error(`Function values are too close. Cannot continue with secant method.`);
       }
       
-      const x2 = x1 - fx1 * (x1 - x0) / (fx1 - fx0);
+      const dx = x1 - x0;
+      const x2 = x1 - fx1 * dx / dfx;
       const fx2 = f(x2);
       result.functionEvaluations++;
       
       const error = Math.abs(x2 - x1);
-      result.iterationHistory.push(new IterationData(i + 1, x2, fx2, error, { x0, x1, slope: (fx1 - fx0)/(x1 - x0) }));
+      result.iterationHistory.push(new IterationData(i + 1, x2, fx2, error, { x0, x1, slope: dfx / dx }));
       
-      if (Math.abs(fx2) < tolerance || error < tolerance) {
+      if (hasConverged(fx2, error, tolerance)) {
         result.root = x2;
         result.convergenceAchieved = true;
         result.finalError = Math.abs(fx2);
@@ -548,7 +723,7 @@ export function fixedPointMethod(gFunctionExpr, x0, tolerance = 1e-6, maxIterati
       }
       
       // Check for divergence
-      if (Math.abs(xNew) > 1e10) {
+      if (!Number.isFinite(xNew) || Math.abs(xNew) > DIVERGENCE_LIMIT) {
         throw new Error('Method appears to be diverging. Try a different initial guess or g(x) function.');
       }
       
@@ -586,6 +761,12 @@ export function mullerMethod(functionExpr, x0, x1, x2, tolerance = 1e-6, maxIter
       // Calculate divided differences
       const h0 = x1 - x0;
       const h1 = x2 - x1;
+      const scale = EPSILON * Math.max(1, Math.abs(x0), Math.abs(x1), Math.abs(x2));
+      
+      if (Math.abs(h0) < scale || Math.abs(h1) < scale) {
+        throw new Error(`Interpolation points are too close. Cannot continue with Muller's method.`);
+      }
+      
       const d0 = (y1 - y0) / h0;
       const d1 = (y2 - y1) / h1;
       const a = (d1 - d0) / (h1 + h0);
@@ -594,28 +775,12 @@ export function mullerMethod(functionExpr, x0, x1, x2, tolerance = 1e-6, maxIter
       
       // Calculate discriminant
       const discriminant = b * b - 4 * a * c;
+      let x3, details;
       
       if (discriminant < 0) {
         // Complex roots - for now, we'll handle the real part
-        const realPart = -b / (2 * a);
-        const x3 = x2 + realPart;
-        const y3 = f(x3);
-        result.functionEvaluations++;
-        
-        const error = Math.abs(x3 - x2);
-        result.iterationHistory.push(new IterationData(i + 1, x3, y3, error, { discriminant, isComplex: true }));
-        
-        if (Math.abs(y3) < tolerance || error < tolerance) {
-          result.root = x3;
-          result.convergenceAchieved = true;
-          result.finalError = Math.abs(y3);
-          result.iterations = i + 1;
-          break;
-        }
-        
-        x0 = x1; y0 = y1;
-        x1 = x2; y1 = y2;
-        x2 = x3; y2 = y3;
+        x3 = x2 - b / (2 * a);
+        details = { discriminant, isComplex: true };
       } else {
         // Real roots
         const sqrtDiscriminant = Math.sqrt(discriminant);
@@ -625,26 +790,28 @@ export function mullerMethod(functionExpr, x0, x1, x2, tolerance = 1e-6, maxIter
         // Choose the denominator with larger absolute value for better numerical stability
         const denom = Math.abs(denom1) > Math.abs(denom2) ? denom1 : denom2;
         
-        const x3 = x2 - 2 * c / denom;
-        const y3 = f(x3);
-        result.functionEvaluations++;
-        
-        const error = Math.abs(x3 - x2);
-        result.iterationHistory.push(new IterationData(i + 1, x3, y3, error, { discriminant, a, b, c }));
-        
-        if (Math.abs(y3) < tolerance || error < tolerance) {
-          result.root = x3;
-          result.convergenceAchieved = true;
-          result.finalError = Math.abs(y3);
-          result.iterations = i + 1;
-          break;
-        }
-        
-        x0 = x1; y0 = y1;
-        x1 = x2; y1 = y2;
-        x2 = x3; y2 = y3;
+        x3 = x2 - 2 * c / denom;
+        details = { discriminant, a, b, c };
       }
       
+      const y3 = f(x3);
+      result.functionEvaluations++;
+      
+      const error = Math.abs(x3 - x2);
+      result.iterationHistory.push(new IterationData(i + 1, x3, y3, error, details));
+      
+      if (hasConverged(y3, error, tolerance)) {
+        result.root = x3;
+        result.convergenceAchieved = true;
+        result.finalError = Math.abs(y3);
+        result.iterations = i + 1;
+        break;
+      }
+      
+      x0 = x1; y0 = y1;
+      x1 = x2; y1 = y2;
+      x2 = x3; y2 = y3;
+      
       result.iterations = i + 1;
     }
     
@@ -708,6 +875,12 @@ export const predefinedFunctions = {
   }
 };
 
+// Compile the predefined functions up front so the first solve does not pay the parse cost
+Object.values(predefinedFunctions).forEach(({ expression, derivative }) => {
+  prepareExpression(expression);
+  prepareExpression(derivative);
+});
+
 // Compares performance of all numerical methods on the same function
 export function compareAllMethods(functionData, tolerance = 1e-6, maxIterations = 100) {
   const results = {};
@@ -719,14 +892,14 @@ export function compareAllMethods(functionData, tolerance = 1e-6, maxIterations
   try {
     results.bisection = bisectionMethod(expression, a, b, tolerance, maxIterations);
   } catch (error) {
-    results.bisection = { errorMessage: error.message };
+    results.bisection = failedResult(error.message);
   }
   
   // False Position Method
   try {
     results.falsePosition = falsePositionMethod(expression, a, b, tolerance, maxIterations);
   } catch (error) {
-    results.falsePosition = { errorMessage: error.message };
+    results.falsePosition = failedResult(error.message);
   }
   
   // Newton-Raphson Method (if derivative is available)
@@ -734,7 +907,7 @@ export function compareAllMethods(functionData, tolerance = 1e-6, maxIterations
     try {
       results.newtonRaphson = newtonRaphsonMethod(expression, derivativeExpr, guess, tolerance, maxIterations);
     } catch (error) {
-      results.newtonRaphson = { errorMessage: error.message };
+      results.newtonRaphson = failedResult(error.message);
     }
   }
   
@@ -742,7 +915,7 @@ export function compareAllMethods(functionData, tolerance = 1e-6, maxIterations
   try {
     results.secant = secantMethod(expression, a, b, tolerance, maxIterations);
   } catch (error) {
-    results.secant = { errorMessage: error.message };
+    results.secant = failedResult(error.message);
   }
   
   // Fixed Point Method (g(x) = x - f(x)/10 as a simple transformation)
@@ -750,7 +923,7 @@ export function compareAllMethods(functionData, tolerance = 1e-6, maxIterations
     const gExpression = `x - (${expression})/10`;
     results.fixedPoint = fixedPointMethod(gExpression, guess, tolerance, maxIterations);
   } catch (error) {
-    results.fixedPoint = { errorMessage: error.message };
+    results.fixedPoint = failedResult(error.message);
   }
   
   // Muller's Method
@@ -758,7 +931,7 @@ export function compareAllMethods(functionData, tolerance = 1e-6, maxIterations
     const mid = (a + b) / 2;
     results.muller = mullerMethod(expression, a, mid, b, tolerance, maxIterations);
   } catch (error) {
-    results.muller = { errorMessage: error.message };
+    results.muller = failedResult(error.message);
   }
   
   return results;
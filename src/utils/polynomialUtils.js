@@ -1,4 +1,11 @@
 // Polynomial utility functions for efficient evaluation and manipulation
+import { parse } from 'mathjs';
+
+// Multiple of machine epsilon in the rounding-error bound used to stop Aberth iterations
+const ROUNDING_SLACK = 4;
+
+// Highest power of x given dense coefficients; anything larger is left to mathjs
+const MAX_POLYNOMIAL_DEGREE = 64;
 
 // Horner's Rule - efficiently evaluates polynomial using nested multiplication
 export function hornersRule(coefficients, x) {
@@ -14,6 +21,64 @@ export function hornersRule(coefficients, x) {
   return result;
 }
 
+// Horner's Rule for P(x) and P'(x) together - the derivative recurrence runs in the same pass
+export function hornersRuleWithDerivative(coefficients, x) {
+  if (!coefficients || coefficients.length === 0) {
+    throw new Error('Coefficients array cannot be empty');
+  }
+
+  let value = coefficients[0];
+  let derivative = 0;
+  for (let i = 1; i < coefficients.length; i++) {
+    derivative = derivative * x + value;
+    value = value * x + coefficients[i];
+  }
+
+  return { value, derivative };
+}
+
+// Horner's Rule at many points at once - folds each coefficient into every point's running value
+export function hornersRuleBatch(coefficients, xValues) {
+  if (!coefficients || coefficients.length === 0) {
+    throw new Error('Coefficients array cannot be empty');
+  }
+
+  const results = new Array(xValues.length).fill(coefficients[0]);
+  for (let i = 1; i < coefficients.length; i++) {
+    const c = coefficients[i];
+    for (let j = 0; j < xValues.length; j++) {
+      results[j] = results[j] * xValues[j] + c;
+    }
+  }
+
+  return results;
+}
+
+// Horner's Rule compiled into one straight-line function with the coefficients inlined as literals
+export function compileHorner(coefficients) {
+  if (!coefficients || coefficients.length === 0) {
+    throw new Error('Coefficients array cannot be empty');
+  }
+
+  // Non-finite coefficients have no numeric literal, and a Content Security Policy without
+  // 'unsafe-eval' forbids new Function; both keep the generic loop
+  let evaluator = (x) => hornersRule(coefficients, x);
+  if (coefficients.every(Number.isFinite)) {
+    // Zero coefficients (as in sparse inputs like x^10 - 1) leave out their addition entirely
+    let body = `(${coefficients[0]})`;
+    for (let i = 1; i < coefficients.length; i++) {
+      body = coefficients[i] === 0 ? `${body} * x` : `(${body} * x + (${coefficients[i]}))`;
+    }
+    try {
+      evaluator = new Function('x', `return ${body};`);
+    } catch (_error) { // eslint-disable-line no-unused-vars
+      // Keep the generic loop
+    }
+  }
+
+  return evaluator;
+}
+
 // Horner's Rule with detailed steps shown for educational purposes
 export function hornersRuleDetailed(coefficients, x) {
   if (!coefficients || coefficients.length === 0) {
@@ -63,11 +128,11 @@ export function polynomialDeflation(coefficients, root) {
     };
   }
 
-  const quotient = [];
+  const quotient = new Array(coefficients.length - 1);
   const steps = [];
   let temp = coefficients[0];
   
-  quotient.push(temp);
+  quotient[0] = temp;
   steps.push({
     step: 0,
     coefficient: coefficients[0],
@@ -82,7 +147,7 @@ export function polynomialDeflation(coefficients, root) {
     temp = coefficients[i] + multiplication;
     
     if (i < coefficients.length - 1) {
-      quotient.push(temp);
+      quotient[i] = temp;
     }
     
     steps.push({
@@ -183,7 +248,8 @@ export function parseCoefficients(input) {
 
 // Applies polynomial deflation successively for multiple known roots
 export function successiveDeflation(coefficients, knownRoots) {
-  let currentCoeffs = [...coefficients];
+  // polynomialDeflation never mutates its input, so the caller's array can seed the loop without a copy
+  let currentCoeffs = coefficients;
   const deflationSteps = [];
   const allRemainders = [];
 
@@ -211,4 +277,269 @@ export function successiveDeflation(coefficients, knownRoots) {
     remainders: allRemainders,
     allExactRoots: allRemainders.every(r => Math.abs(r) < 1e-10)
   };
-} 
\ No newline at end of file
+}
+
+// Initial guesses for all roots at once - points on circles whose radii come from the Newton polygon of log|a_i| (Bini's placement)
+function initialRootGuesses(coefficients) {
+  if (!coefficients || coefficients.length < 2) {
+    throw new Error('Polynomial must have degree at least 1');
+  }
+  const n = coefficients.length - 1;
+  if (coefficients[0] === 0 || coefficients[n] === 0) {
+    throw new Error('Leading and constant coefficients must be nonzero');
+  }
+
+  // Upper convex hull of the points (i, log|a_i|), with a_i the ascending-order coefficients
+  const hull = [];
+  for (let i = 0; i <= n; i++) {
+    const a = coefficients[n - i];
+    if (a === 0) continue;
+    const point = { i, log: Math.log(Math.abs(a)) };
+    while (hull.length >= 2) {
+      const o = hull[hull.length - 2];
+      const m = hull[hull.length - 1];
+      const cross = (m.i - o.i) * (point.log - o.log) - (m.log - o.log) * (point.i - o.i);
+      if (cross < 0) break;
+      hull.pop();
+    }
+    hull.push(point);
+  }
+
+  // Each hull edge spanning k indices contributes k points on a circle of radius (|a_lo| / |a_hi|)^(1/k)
+  const sigma = 0.7;
+  const guesses = [];
+  for (let j = 1; j < hull.length; j++) {
+    const k = hull[j].i - hull[j - 1].i;
+    const radius = Math.exp((hull[j - 1].log - hull[j].log) / k);
+    for (let m = 0; m < k; m++) {
+      const angle = (2 * Math.PI * m) / k + (2 * Math.PI * hull[j - 1].i) / n + sigma;
+      guesses.push({ re: radius * Math.cos(angle), im: radius * Math.sin(angle) });
+    }
+  }
+
+  return guesses;
+}
+
+// P(z) and P'(z) at a complex point z = re + i*im for real coefficients, by Horner's rule,
+// plus the sum of |a_i||z|^i that bounds the rounding error in P(z)
+function complexHornerWithDerivative(coefficients, re, im) {
+  const modulus = Math.hypot(re, im);
+  let pRe = coefficients[0];
+  let pIm = 0;
+  let dRe = 0;
+  let dIm = 0;
+  let scale = Math.abs(coefficients[0]);
+  for (let i = 1; i < coefficients.length; i++) {
+    scale = scale * modulus + Math.abs(coefficients[i]);
+    const nextDRe = dRe * re - dIm * im + pRe;
+    dIm = dRe * im + dIm * re + pIm;
+    dRe = nextDRe;
+    const nextPRe = pRe * re - pIm * im + coefficients[i];
+    pIm = pRe * im + pIm * re;
+    pRe = nextPRe;
+  }
+  return { pRe, pIm, dRe, dIm, scale };
+}
+
+// Complex quotient (aRe + i*aIm) / (bRe + i*bIm) by Smith's algorithm, which never squares |b|
+function complexDivide(aRe, aIm, bRe, bIm) {
+  if (Math.abs(bRe) >= Math.abs(bIm)) {
+    const ratio = bIm / bRe;
+    const denominator = bRe + bIm * ratio;
+    return { re: (aRe + aIm * ratio) / denominator, im: (aIm - aRe * ratio) / denominator };
+  }
+  const ratio = bRe / bIm;
+  const denominator = bRe * ratio + bIm;
+  return { re: (aRe * ratio + aIm) / denominator, im: (aIm * ratio - aRe) / denominator };
+}
+
+// Aberth-Ehrlich method - refines approximations to all roots simultaneously, no deflation needed
+export function findAllRootsAberth(coefficients, tolerance = 1e-12, maxIterations = 200) {
+  if (!coefficients || coefficients.length === 0) {
+    throw new Error('Coefficients array cannot be empty');
+  }
+
+  // Leading zeros do not change the polynomial
+  let start = 0;
+  while (start < coefficients.length - 1 && coefficients[start] === 0) start++;
+  if (coefficients[start] === 0) {
+    throw new Error('The zero polynomial has infinitely many roots');
+  }
+
+  // Dividing through by the leading coefficient keeps tiny or huge inputs away from underflow and overflow;
+  // trailing zeros, including any the division underflowed to, are roots at the origin
+  const leading = coefficients[start];
+  const monic = coefficients.slice(start).map(c => c / leading);
+  let end = monic.length;
+  while (end > 1 && monic[end - 1] === 0) end--;
+  const reduced = monic.slice(0, end);
+  const roots = new Array(monic.length - end).fill(null).map(() => ({ re: 0, im: 0 }));
+  if (reduced.length < 2) {
+    return { roots, iterations: 0, converged: true };
+  }
+
+  const reversed = reduced.slice().reverse();
+  const guesses = initialRootGuesses(reduced);
+  const n = guesses.length;
+  let zRe = guesses.map(g => g.re);
+  let zIm = guesses.map(g => g.im);
+  const done = new Array(n).fill(false);
+  let remaining = n;
+  let iterations = 0;
+
+  while (remaining > 0 && iterations < maxIterations) {
+    iterations++;
+
+    // Every correction in a sweep uses the previous sweep's approximations
+    const nextRe = zRe.slice();
+    const nextIm = zIm.slice();
+    for (let k = 0; k < n; k++) {
+      if (done[k]) continue;
+
+      const re = zRe[k];
+      const im = zIm[k];
+
+      // s = sum over j != k of 1 / (z_k - z_j)
+      let sRe = 0;
+      let sIm = 0;
+      for (let j = 0; j < n; j++) {
+        if (j === k) continue;
+        const inverse = complexDivide(1, 0, re - zRe[j], im - zIm[j]);
+        sRe += inverse.re;
+        sIm += inverse.im;
+      }
+
+      // Newton ratio in logarithmic form, L = p'/p; outside the unit circle it comes from the reversed
+      // polynomial q(w) = w^n p(1/w), since p'(z)/p(z) = w (n - w q'(w)/q(w)) and q(w) cannot overflow there
+      const outside = Math.hypot(re, im) > 1;
+      const w = outside ? complexDivide(1, 0, re, im) : { re, im };
+      const { pRe, pIm, dRe, dIm, scale } = complexHornerWithDerivative(outside ? reversed : reduced, w.re, w.im);
+      let cRe = 0;
+      let cIm = 0;
+      if (pRe !== 0 || pIm !== 0) {
+        let { re: lRe, im: lIm } = complexDivide(dRe, dIm, pRe, pIm);
+        if (outside) {
+          const tRe = n - (w.re * lRe - w.im * lIm);
+          const tIm = -(w.re * lIm + w.im * lRe);
+          lRe = w.re * tRe - w.im * tIm;
+          lIm = w.re * tIm + w.im * tRe;
+        }
+
+        // Correction 1 / (L - s) = p / (p' - p*s), the Newton step damped by the repulsion from the other roots
+        if (lRe === sRe && lIm === sIm) continue;
+        ({ re: cRe, im: cIm } = complexDivide(1, 0, lRe - sRe, lIm - sIm));
+      }
+
+      // A root is settled once its step is tiny or P(z) (or q(w)) is already down at rounding-error level;
+      // an overflowed P(z) can pass the second test, so the new iterate must also be finite
+      nextRe[k] = re - cRe;
+      nextIm[k] = im - cIm;
+      const settled = Math.hypot(cRe, cIm) <= tolerance * Math.max(1, Math.hypot(re, im))
+        || Math.hypot(pRe, pIm) <= ROUNDING_SLACK * Number.EPSILON * scale;
+      if (settled && Number.isFinite(nextRe[k]) && Number.isFinite(nextIm[k])) {
+        done[k] = true;
+        remaining--;
+      }
+    }
+    zRe = nextRe;
+    zIm = nextIm;
+  }
+
+  for (let k = 0; k < n; k++) {
+    roots.push({ re: zRe[k], im: zIm[k] });
+  }
+
+  return { roots, iterations, converged: remaining === 0 };
+}
+
+// Adds two ascending-order coefficient arrays
+function addAscending(p, q) {
+  const sum = new Array(Math.max(p.length, q.length)).fill(0);
+  p.forEach((c, i) => { sum[i] += c; });
+  q.forEach((c, i) => { sum[i] += c; });
+  return sum;
+}
+
+// Converts an expanded polynomial term tree into ascending-order coefficients, or null
+function termsToAscending(node) {
+  switch (node.type) {
+    case 'ConstantNode':
+      return typeof node.value === 'number' ? [node.value] : null;
+    case 'SymbolNode':
+      return node.name === 'x' ? [0, 1] : null;
+    case 'ParenthesisNode':
+      return termsToAscending(node.content);
+    case 'OperatorNode':
+      break;
+    default:
+      return null;
+  }
+
+  const args = node.args;
+
+  if (node.fn === 'pow') {
+    // Only x^n with a literal integer n in 0..MAX_POLYNOMIAL_DEGREE
+    const [base, exponent] = args;
+    const n = exponent.type === 'ConstantNode' ? exponent.value : NaN;
+    if (base.type !== 'SymbolNode' || base.name !== 'x' || !Number.isInteger(n) || n < 0 || n > MAX_POLYNOMIAL_DEGREE) {
+      return null;
+    }
+    const monomial = new Array(n + 1).fill(0);
+    monomial[n] = 1;
+    return monomial;
+  }
+
+  const operands = args.map(termsToAscending);
+  if (operands.some(operand => operand === null)) {
+    return null;
+  }
+
+  switch (node.fn) {
+    case 'unaryPlus':
+      return operands[0];
+    case 'unaryMinus':
+      return operands[0].map(c => -c);
+    case 'add':
+      return operands.reduce(addAscending);
+    case 'subtract':
+      return addAscending(operands[0], operands[1].map(c => -c));
+    case 'multiply': {
+      // Scaling a term by constants keeps the expression expanded; products of terms do not
+      const terms = operands.filter(operand => operand.length > 1);
+      if (terms.length > 1) {
+        return null;
+      }
+      const factor = operands.filter(operand => operand.length === 1).reduce((product, [c]) => product * c, 1);
+      return (terms[0] || [1]).map(c => c * factor);
+    }
+    case 'divide': {
+      const [numerator, denominator] = operands;
+      if (denominator.length !== 1 || denominator[0] === 0) {
+        return null;
+      }
+      return numerator.map(c => c / denominator[0]);
+    }
+    default:
+      return null;
+  }
+}
+
+// Extracts descending coefficients from an expanded polynomial expression in x (e.g. "x^3 - 2*x - 5"), or null otherwise
+export function expressionToCoefficients(expression) {
+  let node;
+  try {
+    node = parse(expression);
+  } catch (_error) { // eslint-disable-line no-unused-vars
+    return null;
+  }
+
+  const ascending = termsToAscending(node);
+  if (!ascending) {
+    return null;
+  }
+
+  while (ascending.length > 1 && ascending[ascending.length - 1] === 0) {
+    ascending.pop();
+  }
+  return ascending.reverse();
+}
\ No newline at end of file